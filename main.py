@@ -3,11 +3,14 @@
 YouTube_Trimmer - A video trimming application with fade effects
 """
 import sys
+import logging
 from PyQt5.QtWidgets import QApplication
 from ui.main_window import MainWindow
 
 def main():
     """Main application entry point"""
+    logging.basicConfig(level=logging.WARNING)
+
     app = QApplication(sys.argv)
     app.setApplicationName("YouTube_Trimmer")
     window = MainWindow()
@@ -1,8 +1,8 @@
 """
 Data model for video segment with timecodes and fade information
 """
-from dataclasses import dataclass
-from typing import Optional
+from dataclasses import dataclass, field
+from typing import Optional, Tuple
 
 
 @dataclass
@@ -20,6 +20,10 @@ class VideoSegment:
     # Optional segment name for identifying multiple segments
     name: Optional[str] = None
     
+    # Duration memoized for the (start_time, end_time) it was computed from
+    _duration_key: Optional[Tuple[str, str]] = field(default=None, init=False, repr=False, compare=False)
+    _duration: float = field(default=0.0, init=False, repr=False, compare=False)
+    
     def __post_init__(self):
         """Validate the data types after initialization"""
         # Ensure start_time and end_time are strings
@@ -39,7 +43,11 @@ class VideoSegment:
     @property
     def duration(self) -> float:
         """Calculate segment duration in seconds"""
-        return self.time_to_seconds(self.end_time) - self.time_to_seconds(self.start_time)
+        key = (self.start_time, self.end_time)
+        if key != self._duration_key:
+            self._duration = self.time_to_seconds(self.end_time) - self.time_to_seconds(self.start_time)
+            self._duration_key = key
+        return self._duration
     
     @staticmethod
     def time_to_seconds(time_str: str) -> float:
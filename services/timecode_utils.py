@@ -1,7 +1,6 @@
 """
 Utility functions for handling timecodes
 """
-import re
 from typing import Union, Tuple
 
 
@@ -16,8 +15,22 @@ def validate_timecode(timecode: str) -> bool:
         bool: True if format is valid, False otherwise
     """
     # Match multiple formats: HH:MM:SS, HH:MM:SS.mmm, and HH:MM:SS:mmm
-    pattern = r'^\d{2}:\d{2}:\d{2}(?:[:.]\d{1,3})?$'
-    return bool(re.match(pattern, timecode))
+    # using fixed-position character checks (called on every keystroke)
+    length = len(timecode)
+    if length != 8 and not 10 <= length <= 12:
+        return False
+    
+    if timecode[2] != ':' or timecode[5] != ':':
+        return False
+    
+    if not (timecode[0:2] + timecode[3:5] + timecode[6:8]).isdecimal():
+        return False
+    
+    if length == 8:
+        return True
+    
+    # Optional milliseconds: separator followed by 1-3 digits
+    return timecode[8] in ':.' and timecode[9:].isdecimal()
 
 
 def timecode_to_seconds(timecode: str) -> float:
@@ -3,6 +3,7 @@ Video processing service for trimming videos with fades using FFmpeg with absolu
 """
 import os
 import cv2
+import logging
 import subprocess
 import tempfile
 import shutil
@@ -10,6 +11,8 @@ from typing import List, Optional, Tuple
 from models.video_segment import VideoSegment
 from services.timecode_utils import timecode_to_seconds
 
+logger = logging.getLogger(__name__)
+
 
 class VideoProcessor:
     """Handles video processing operations including trimming and applying fades"""
@@ -125,9 +128,9 @@ class VideoProcessor:
             end_seconds = segment.time_to_seconds(segment.end_time)
             duration = end_seconds - start_seconds
             
-            print(f"Segment duration: {duration} seconds")
-            print(f"Start time: {start_seconds} seconds")
-            print(f"End time: {end_seconds} seconds")
+            logger.debug("Segment duration: %s seconds", duration)
+            logger.debug("Start time: %s seconds", start_seconds)
+            logger.debug("End time: %s seconds", end_seconds)
             
             # Use a direct approach that keeps the absolute timestamps
             # This method avoids the seek (-ss) changing the timestamps
@@ -148,7 +151,7 @@ class VideoProcessor:
                     trimmed_file
                 ]
                 
-                print(f"Trimming command: {' '.join(trim_cmd)}")
+                logger.debug("Trimming command: %s", ' '.join(trim_cmd))
                 subprocess.run(trim_cmd, check=True, capture_output=True, text=True)
                 
                 # Step 2: Apply fades using absolute timestamps
@@ -157,7 +160,7 @@ class VideoProcessor:
                 
                 # Skip fades if they're too large
                 if fade_in_sec + fade_out_sec > duration * 0.9:
-                    print("Fades are too long for clip duration - disabling fades")
+                    logger.warning("Fades are too long for clip duration - disabling fades")
                     fade_in_sec = 0
                     fade_out_sec = 0
                 
@@ -165,8 +168,8 @@ class VideoProcessor:
                 fade_in_end = start_seconds + fade_in_sec if fade_in_sec > 0 else 0
                 fade_out_start = end_seconds - fade_out_sec if fade_out_sec > 0 else 0
                 
-                print(f"Fade in from {start_seconds}s to {fade_in_end}s")
-                print(f"Fade out from {fade_out_start}s to {end_seconds}s")
+                logger.debug("Fade in from %ss to %ss", start_seconds, fade_in_end)
+                logger.debug("Fade out from %ss to %ss", fade_out_start, end_seconds)
                 
                 # Build complex filtergraph for absolute timestamps
                 vf_parts = []
@@ -206,7 +209,7 @@ class VideoProcessor:
                     output_path
                 ])
                 
-                print(f"Final processing command: {' '.join(final_cmd)}")
+                logger.debug("Final processing command: %s", ' '.join(final_cmd))
                 subprocess.run(final_cmd, check=True, capture_output=True, text=True)
                 
                 # Verify output file
@@ -220,10 +223,10 @@ class VideoProcessor:
                 shutil.rmtree(temp_dir, ignore_errors=True)
                 
         except Exception as e:
-            print(f"Error in direct absolute trim: {str(e)}")
+            logger.warning("Error in direct absolute trim: %s", e)
             
             # Fall back to simple trim method
-            print("Falling back to simple trim method...")
+            logger.warning("Falling back to simple trim method...")
             return self._simple_trim(segment, output_path)
     
     def _simple_trim(self, segment: VideoSegment, output_path: str) -> str:
@@ -253,13 +256,13 @@ class VideoProcessor:
                 output_path
             ]
             
-            print(f"Simple fallback command: {' '.join(cmd)}")
+            logger.debug("Simple fallback command: %s", ' '.join(cmd))
             subprocess.run(cmd, check=True, capture_output=True, text=True)
             
             return output_path
             
         except Exception as e:
-            print(f"Error in simple fallback: {str(e)}")
+            logger.error("Error in simple fallback: %s", e)
             raise
     
     def _concatenate_videos(self, input_files: List[str], output_file: str):
@@ -289,7 +292,7 @@ class VideoProcessor:
                 output_file
             ]
             
-            print(f"Concatenating videos with command: {' '.join(cmd)}")
+            logger.debug("Concatenating videos with command: %s", ' '.join(cmd))
             
             # Execute the command
             subprocess.run(cmd, check=True, capture_output=True, text=True)
@@ -299,7 +302,7 @@ class VideoProcessor:
                 raise ValueError("Failed to create output file")
                 
         except Exception as e:
-            print(f"Error concatenating videos: {str(e)}")
+            logger.error("Error concatenating videos: %s", e)
             raise
             
         finally:
@@ -314,6 +317,24 @@ class VideoProcessor:
         Args:
             timecode: Timecode in HH:MM:SS format
             
+        Returns:
+            tuple: (width, height, frame_data) or None if failed
+        """
+        try:
+            seconds = timecode_to_seconds(timecode)
+        except ValueError as e:
+            logger.warning("Error getting frame: %s", e)
+            return None
+        
+        return self.get_frame_at_seconds(seconds)
+    
+    def get_frame_at_seconds(self, seconds: float) -> Optional[Tuple[int, int, bytes]]:
+        """
+        Get a frame from the video at the specified time in seconds
+        
+        Args:
+            seconds: Time in seconds
+            
         Returns:
             tuple: (width, height, frame_data) or None if failed
         """
@@ -321,7 +342,6 @@ class VideoProcessor:
             return None
         
         try:
-            seconds = timecode_to_seconds(timecode)
             if seconds < 0 or seconds > self.duration:
                 return None
             
@@ -357,7 +377,7 @@ class VideoProcessor:
             return result
             
         except Exception as e:
-            print(f"Error getting frame: {str(e)}")
+            logger.warning("Error getting frame: %s", e)
             return None
     
     def close(self):
@@ -8,7 +8,7 @@ from PyQt5.QtWidgets import (
     QPushButton, QFileDialog, QLabel, QAction, QMenu,
     QMessageBox, QSplitter, QStatusBar, QStyle
 )
-from PyQt5.QtCore import Qt, QSize
+from PyQt5.QtCore import Qt, QSize, QTimer
 from PyQt5.QtGui import QIcon
 
 from ui.trim_panel import TrimPanel
@@ -26,7 +26,7 @@ class MainWindow(QMainWindow):
         super().__init__()
         
         # Initialize state
-        self.config_manager = ConfigManager()
+        self.config_manager = ConfigManager(flush_scheduler=self._schedule_config_flush)
         self.video_processor: Optional[VideoProcessor] = None
         self.current_file_path: Optional[str] = None
         self.segments: List[VideoSegment] = []
@@ -42,6 +42,16 @@ class MainWindow(QMainWindow):
         # Update UI state
         self._update_ui_state()
     
+    def _schedule_config_flush(self, flush):
+        """
+        Save configuration changes shortly after they are made
+        
+        Args:
+            flush: Callback that writes pending changes
+        """
+        # Changes made within this window share a single write
+        QTimer.singleShot(500, flush)
+    
     def _setup_ui(self):
         """Set up the main UI components"""
         # Create main layout
@@ -384,6 +394,8 @@ class MainWindow(QMainWindow):
     def closeEvent(self, event):
         """Handle window close event"""
         # Clean up resources
+        self.preview_panel.close()
+        self.config_manager.flush()
         if self.video_processor:
             self.video_processor.close()
         
@@ -2,19 +2,32 @@
 Panel for video preview with internal playback using OpenCV
 """
 import os
+import time
+import threading
 import cv2
+from collections import OrderedDict
 from typing import Optional
 from PyQt5.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QPushButton, 
     QLabel, QSlider, QLineEdit, QFormLayout, QStyle,
     QSizePolicy, QMessageBox, QFrame
 )
-from PyQt5.QtCore import Qt, QTimer, QRegExp, QSize
+from PyQt5.QtCore import Qt, QTimer, QRegExp, QSize, QObject, QThread, QUrl, pyqtSignal, pyqtSlot
 from PyQt5.QtGui import QPixmap, QImage, QRegExpValidator
 
+# Qt Multimedia is optional; without it playback falls back to OpenCV decoding
+try:
+    from PyQt5.QtMultimedia import QMediaPlayer, QMediaContent
+    from PyQt5.QtMultimediaWidgets import QVideoWidget
+except ImportError:
+    QMediaPlayer = None
+
 from services.video_processor import VideoProcessor
 from services.timecode_utils import timecode_to_seconds, seconds_to_timecode
 
+# Timecode input pattern (HH:MM:SS with optional milliseconds), built once
+_TIMECODE_REGEX = QRegExp(r'\d{2}:\d{2}:\d{2}(?:[:.]\d{1,3})?')
+
 
 class VideoPreviewWidget(QLabel):
     """Widget for displaying video frames"""
@@ -26,57 +39,160 @@ class VideoPreviewWidget(QLabel):
         self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
         self.setStyleSheet("background-color: black;")
         self.setText("No video loaded")
+        
+        # Unscaled image of the current frame, rescaled on resize.
+        # The QImage wraps _rgb_buf without copying, so both are kept together.
+        self._rgb_buf = None
+        self._source_image: Optional[QImage] = None
+        self._is_cleared = True
+        
+        # Coalesce bursts of resize events (window drags) into one rescale
+        self._rescale_timer = QTimer(self)
+        self._rescale_timer.setSingleShot(True)
+        self._rescale_timer.setInterval(16)
+        self._rescale_timer.timeout.connect(self._rescale_from_source)
     
-    def display_frame(self, frame):
+    def display_frame(self, frame, smooth: bool = True):
         """
         Display a video frame (OpenCV format)
         
         Args:
             frame: OpenCV frame (numpy array)
+            smooth: Use smooth scaling; pass False for in-flight playback frames
         """
+        self._is_cleared = False
+        
         if frame is None:
             self.setText("No frame available")
             return
             
         try:
-            # Convert BGR to RGB
-            rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+            # For playback frames, shrink in OpenCV first so the colour
+            # conversion and the Qt scale below both work on fewer pixels
+            if not smooth:
+                h, w = frame.shape[:2]
+                scale = min(self.width() / w, self.height() / h)
+                if scale < 1.0:
+                    target = (max(1, int(w * scale)), max(1, int(h * scale)))
+                    frame = cv2.resize(frame, target, interpolation=cv2.INTER_LINEAR)
+            
+            # Convert BGR to 32-bit RGBX so Qt's scaling/blitting fast paths apply.
+            # The output buffer is reused while the frame size stays the same.
+            h, w = frame.shape[:2]
+            if self._rgb_buf is not None and self._rgb_buf.shape[:2] == (h, w):
+                cv2.cvtColor(frame, cv2.COLOR_BGR2RGBA, dst=self._rgb_buf)
+            else:
+                self._rgb_buf = cv2.cvtColor(frame, cv2.COLOR_BGR2RGBA)
             
-            # Create QImage from frame
-            h, w, ch = rgb_frame.shape
-            bytes_per_line = ch * w
-            img = QImage(rgb_frame.data, w, h, bytes_per_line, QImage.Format_RGB888)
+            # Create QImage over the frame buffer (no copy). Qt does not own the
+            # memory, so the array is stored alongside the image to keep it alive.
+            bytes_per_line = self._rgb_buf.strides[0]
+            img = QImage(self._rgb_buf.data, w, h, bytes_per_line, QImage.Format_RGBX8888)
+            self._source_image = img
             
-            # Scale pixmap to fit widget while preserving aspect ratio
-            pixmap = QPixmap.fromImage(img)
-            scaled_pixmap = pixmap.scaled(
+            # Scale once to fit widget while preserving aspect ratio
+            scaled_img = img.scaled(
                 self.size(),
                 Qt.KeepAspectRatio,
-                Qt.SmoothTransformation
+                Qt.SmoothTransformation if smooth else Qt.FastTransformation
             )
             
             # Set pixmap and clear text
-            self.setPixmap(scaled_pixmap)
+            self.setPixmap(QPixmap.fromImage(scaled_img))
             
         except Exception as e:
             self.setText(f"Error displaying frame: {str(e)}")
     
     def clear(self):
         """Clear the display"""
-        self.clear()
+        # Nothing to do if the placeholder is already shown
+        if self._is_cleared:
+            return
+        
+        super().clear()
+        self._rgb_buf = None
+        self._source_image = None
         self.setText("No video loaded")
+        self._is_cleared = True
     
-    def resizeEvent(self, event):
-        """Handle resize events"""
-        if self.pixmap() and not self.pixmap().isNull():
-            self.setPixmap(self.pixmap().scaled(
-                event.size(),
+    def _rescale_from_source(self):
+        """Rescale the original frame to the current widget size"""
+        # Always scale from the original frame, never from the previous scaled copy
+        if self._source_image is not None and not self._source_image.isNull():
+            self.setPixmap(QPixmap.fromImage(self._source_image.scaled(
+                self.size(),
                 Qt.KeepAspectRatio,
                 Qt.SmoothTransformation
-            ))
+            )))
+    
+    def resizeEvent(self, event):
+        """Handle resize events"""
+        if self._source_image is not None:
+            self._rescale_timer.start()
         super().resizeEvent(event)
 
 
+class FrameWorker(QObject):
+    """Decodes seek/scrub frames on a background thread, newest request wins"""
+    
+    # Signal with the decoded frame number and OpenCV frame (None on failure)
+    frame_ready = pyqtSignal(int, object)
+    
+    # Internal signal used to wake the worker in its own thread
+    _wake = pyqtSignal()
+    
+    def __init__(self, video_path: str):
+        """
+        Initialize the frame worker
+        
+        Args:
+            video_path: Path to the video file
+        """
+        super().__init__()
+        
+        self._video_path = video_path
+        self._capture = None
+        self._pending: Optional[int] = None
+        self._lock = threading.Lock()
+        self._wake.connect(self._process)
+    
+    def request_frame(self, frame_number: int):
+        """
+        Request a frame, replacing any request that has not started yet
+        
+        Args:
+            frame_number: Frame to decode
+        """
+        with self._lock:
+            self._pending = frame_number
+        self._wake.emit()
+    
+    @pyqtSlot()
+    def _process(self):
+        """Decode the most recently requested frame"""
+        with self._lock:
+            frame_number = self._pending
+            self._pending = None
+        
+        # Already handled by an earlier wake-up
+        if frame_number is None:
+            return
+        
+        # Open lazily so the capture lives in the worker thread
+        if self._capture is None:
+            self._capture = cv2.VideoCapture(self._video_path)
+        
+        self._capture.set(cv2.CAP_PROP_POS_FRAMES, frame_number)
+        ret, frame = self._capture.read()
+        self.frame_ready.emit(frame_number, frame if ret else None)
+    
+    def release(self):
+        """Release the capture (call once the worker thread has stopped)"""
+        if self._capture is not None:
+            self._capture.release()
+            self._capture = None
+
+
 class PreviewPanel(QWidget):
     """Panel for video preview with playback controls"""
     
@@ -94,10 +210,34 @@ class PreviewPanel(QWidget):
         self.fps = 0.0
         self.total_frames = 0
         
+        # Background decoder for seeks and scrubbing
+        self._frame_thread: Optional[QThread] = None
+        self._frame_worker: Optional[FrameWorker] = None
+        self._requested_frame: Optional[int] = None
+        
+        # Set while the timeline slider is held; release performs the one seek
+        self._suppress_frame_requests = False
+        
+        # Recently decoded seek/scrub frames, least recently used first
+        self._frame_cache: "OrderedDict[int, object]" = OrderedDict()
+        self._cache_byte_limit = 128 * 1024 * 1024  # Bounds memory whatever the resolution
+        self._cache_bytes = 0
+        
         # Timer for video playback
         self.playback_timer = QTimer(self)
         self.playback_timer.timeout.connect(self._update_frame)
         
+        # Wall-clock anchor used to keep playback cadence when decoding lags
+        self._play_wallclock0 = 0.0
+        self._play_frame0 = 0
+        
+        # Coalesce slider scrubbing so at most one preview runs per ~frame period
+        self._pending_slider_position = 0
+        self._slider_preview_timer = QTimer(self)
+        self._slider_preview_timer.setSingleShot(True)
+        self._slider_preview_timer.setInterval(33)
+        self._slider_preview_timer.timeout.connect(self._preview_slider_position)
+        
         self._setup_ui()
     
     def _setup_ui(self):
@@ -108,11 +248,17 @@ class PreviewPanel(QWidget):
         self.preview_widget = VideoPreviewWidget()
         layout.addWidget(self.preview_widget, 1)  # Give it all available space
         
+        # Native playback surface, swapped in for the preview while playing
+        self.media_player = None
+        self.video_widget = None
+        self._player_active = False
+        self._create_media_player()
+        
         # Timecode display and seek
         time_layout = QHBoxLayout()
         
         self.current_timecode = QLineEdit("00:00:00")
-        self.current_timecode.setValidator(QRegExpValidator(QRegExp(r'\d{2}:\d{2}:\d{2}(?:[:.]\d{1,3})?')))
+        self.current_timecode.setValidator(QRegExpValidator(_TIMECODE_REGEX, self))
         self.current_timecode.returnPressed.connect(self._seek_to_current_timecode)
         time_layout.addWidget(QLabel("Current Position:"))
         time_layout.addWidget(self.current_timecode)
@@ -199,10 +345,11 @@ class PreviewPanel(QWidget):
             video_path: Path to the video file
             processor: VideoProcessor instance
         """
-        # Close any existing video
-        if self.video_capture is not None:
-            self.video_capture.release()
-            self.video_capture = None
+        # Close any existing video and drop its frame buffers
+        self._release()
+        
+        # Retry the native player if an earlier video made it fall back
+        self._create_media_player()
         
         # Store references
         self.video_path = video_path
@@ -220,6 +367,19 @@ class PreviewPanel(QWidget):
             self.total_frames = int(self.video_capture.get(cv2.CAP_PROP_FRAME_COUNT))
             self.duration = self.total_frames / self.fps if self.fps > 0 else 0
             
+            # Load the file into the native player
+            if self.media_player is not None:
+                self.media_player.setMedia(QMediaContent(QUrl.fromLocalFile(video_path)))
+            
+            # Start the background decoder for seek/scrub frames
+            self._frame_thread = QThread(self)
+            self._frame_worker = FrameWorker(video_path)
+            self._frame_worker.moveToThread(self._frame_thread)
+            self._frame_worker.frame_ready.connect(self._on_frame_ready)
+            # The worker is deleted on its own thread as that thread finishes
+            self._frame_thread.finished.connect(self._frame_worker.deleteLater)
+            self._frame_thread.start()
+            
             # Set timer interval based on FPS
             self._set_playback_speed(self.speed_slider.value())
             
@@ -241,6 +401,40 @@ class PreviewPanel(QWidget):
             self.status_label.setText("Error loading video")
             return
     
+    def _release(self):
+        """Stop playback and free the capture and any buffered frame data"""
+        self._stop_playback()
+        self._slider_preview_timer.stop()
+        self.is_playing = False
+        
+        if self.media_player is not None:
+            self.media_player.stop()
+            self.media_player.setMedia(QMediaContent())
+        self._requested_frame = None
+        self._frame_cache.clear()
+        self._cache_bytes = 0
+        
+        if self._frame_thread is not None:
+            self._frame_worker.frame_ready.disconnect(self._on_frame_ready)
+            self._frame_thread.quit()
+            self._frame_thread.wait()
+            self._frame_worker.release()
+            self._frame_thread.deleteLater()
+            self._frame_thread = None
+            self._frame_worker = None
+        
+        if self.video_capture is not None:
+            self.video_capture.release()
+            self.video_capture = None
+        
+        # Clearing the preview also drops the cached source frame
+        self.preview_widget.clear()
+    
+    def closeEvent(self, event):
+        """Handle close event"""
+        self._release()
+        super().closeEvent(event)
+    
     def _update_controls_state(self, enabled: bool):
         """
         Update the state of the controls
@@ -258,7 +452,7 @@ class PreviewPanel(QWidget):
         # Reset play/pause button icon
         self.is_playing = False
         self.play_button.setIcon(self.style().standardIcon(QStyle.SP_MediaPlay))
-        self.playback_timer.stop()
+        self._stop_playback()
     
     def _toggle_play(self):
         """Toggle play/pause state"""
@@ -267,8 +461,8 @@ class PreviewPanel(QWidget):
         
         if self.is_playing:
             # Pause playback
-            self.playback_timer.stop()
             self.is_playing = False
+            self._stop_playback()
             self.play_button.setIcon(self.style().standardIcon(QStyle.SP_MediaPlay))
         else:
             # Start playback
@@ -276,10 +470,106 @@ class PreviewPanel(QWidget):
                 # If at the end, loop back to beginning
                 self._seek_to_time(0.0)
             
-            self.playback_timer.start()
+            self._start_playback()
             self.is_playing = True
             self.play_button.setIcon(self.style().standardIcon(QStyle.SP_MediaPause))
     
+    def _start_playback(self):
+        """Start playback in the native player, or with OpenCV as a fallback"""
+        if self.media_player is not None:
+            self.media_player.setPlaybackRate(self.speed_slider.value() / 100.0)
+            self.media_player.setPosition(int(self.current_time * 1000))
+            self.preview_widget.hide()
+            self.video_widget.show()
+            self.media_player.play()
+            self._player_active = True
+        else:
+            self._reset_playback_clock()
+            self.playback_timer.start()
+    
+    def _stop_playback(self):
+        """Stop whichever playback path is running and show a still frame"""
+        self.playback_timer.stop()
+        
+        if not self._player_active:
+            return
+        
+        # Take over the player position and show the matching frame in the preview
+        self._player_active = False
+        self.media_player.pause()
+        self.current_time = min(self.media_player.position() / 1000.0, self.duration)
+        self.video_widget.hide()
+        self.preview_widget.show()
+        self._seek_to_time(self.current_time)
+    
+    def _on_player_position(self, position_ms: int):
+        """
+        Track the native player position
+        
+        Args:
+            position_ms: Player position in milliseconds
+        """
+        if not self._player_active:
+            return
+        
+        self.current_time = min(position_ms / 1000.0, self.duration)
+        self._update_ui_for_time(self.current_time)
+    
+    def _on_player_status(self, status):
+        """Stop playback when the native player reaches the end"""
+        if status == QMediaPlayer.EndOfMedia and self.is_playing:
+            self._toggle_play()
+    
+    def _create_media_player(self):
+        """Create the native player and its video widget if possible"""
+        if QMediaPlayer is None or self.media_player is not None:
+            return
+        
+        player = QMediaPlayer(self, QMediaPlayer.VideoSurface)
+        if not player.isAvailable():
+            player.deleteLater()
+            return
+        
+        # Place the video widget right below the frame preview it replaces
+        layout = self.layout()
+        self.video_widget = QVideoWidget()
+        self.video_widget.hide()
+        layout.insertWidget(layout.indexOf(self.preview_widget) + 1, self.video_widget, 1)
+        
+        player.setVideoOutput(self.video_widget)
+        player.setNotifyInterval(40)
+        player.positionChanged.connect(self._on_player_position)
+        player.mediaStatusChanged.connect(self._on_player_status)
+        player.error.connect(self._on_player_error)
+        self.media_player = player
+    
+    def _destroy_media_player(self):
+        """Disconnect and delete the native player and its video widget"""
+        if self.media_player is None:
+            return
+        
+        player = self.media_player
+        player.positionChanged.disconnect(self._on_player_position)
+        player.mediaStatusChanged.disconnect(self._on_player_status)
+        player.error.disconnect(self._on_player_error)
+        player.stop()
+        player.deleteLater()
+        self.media_player = None
+        
+        self.layout().removeWidget(self.video_widget)
+        self.video_widget.deleteLater()
+        self.video_widget = None
+    
+    def _on_player_error(self, error):
+        """Fall back to OpenCV playback if the native player fails"""
+        was_playing = self.is_playing and self._player_active
+        self._stop_playback()
+        self._destroy_media_player()
+        self.status_label.setText("Native playback unavailable, using software playback")
+        
+        if was_playing:
+            self._start_playback()
+    
     def _set_playback_speed(self, speed_percent):
         """
         Set the playback speed
@@ -295,6 +585,23 @@ class PreviewPanel(QWidget):
             
             # Update speed label
             self.speed_label.setText(f"{speed_percent}%")
+            
+            if self._player_active:
+                self.media_player.setPlaybackRate(speed_percent / 100.0)
+            
+            # Re-anchor so the new speed applies from the current frame
+            if self.is_playing:
+                self._reset_playback_clock()
+    
+    def _reset_playback_clock(self):
+        """Anchor playback timing to the current frame and wall-clock time"""
+        self._play_wallclock0 = time.monotonic()
+        self._play_frame0 = int(round(self.current_time * self.fps))
+    
+    def _continue_playback_from_current_time(self):
+        """Re-anchor running playback after a seek so it continues from the new position"""
+        if self.is_playing:
+            self._reset_playback_clock()
     
     def _update_frame(self):
         """Update the current frame during playback"""
@@ -302,16 +609,34 @@ class PreviewPanel(QWidget):
             return
         
         # Get current position
-        current_frame = int(self.current_time * self.fps)
-        next_frame = current_frame + 1
+        current_frame = int(round(self.current_time * self.fps))
+        
+        # Work out which frame should be on screen from the elapsed wall-clock time
+        speed = self.speed_slider.value() / 100.0
+        elapsed = time.monotonic() - self._play_wallclock0
+        target_frame = self._play_frame0 + int(elapsed * self.fps * speed)
+        
+        if target_frame <= current_frame:
+            # Timer fired early, keep the current frame
+            return
         
-        if next_frame >= self.total_frames:
+        if target_frame >= self.total_frames:
             # End of video reached
             self._toggle_play()  # Stop playback
             return
         
-        # Seek to next frame
-        self.video_capture.set(cv2.CAP_PROP_POS_FRAMES, next_frame)
+        # Only seek if the decoder is not already positioned on the next frame
+        next_frame = current_frame + 1
+        if int(self.video_capture.get(cv2.CAP_PROP_POS_FRAMES)) != next_frame:
+            self.video_capture.set(cv2.CAP_PROP_POS_FRAMES, next_frame)
+        
+        # Drop the frames we are behind on; grab() skips the decode/convert step
+        while next_frame < target_frame:
+            if not self.video_capture.grab():
+                self._toggle_play()  # Stop playback
+                return
+            next_frame += 1
+        
         ret, frame = self.video_capture.read()
         
         if not ret:
@@ -320,13 +645,13 @@ class PreviewPanel(QWidget):
             return
         
         # Update current time
-        self.current_time = next_frame / self.fps
+        self.current_time = target_frame / self.fps
         
         # Update UI
         self._update_ui_for_time(self.current_time)
         
-        # Display the frame
-        self.preview_widget.display_frame(frame)
+        # Display the frame (fast scaling, it is on screen for a single tick)
+        self.preview_widget.display_frame(frame, smooth=False)
     
     def _update_ui_for_time(self, seconds):
         """
@@ -337,14 +662,25 @@ class PreviewPanel(QWidget):
         """
         # Update timecode display
         if not self.current_timecode.hasFocus():
-            self.current_timecode.setText(seconds_to_timecode(seconds))
+            self._set_timecode_text(seconds_to_timecode(seconds))
         
-        # Update slider position
+        # Update slider position, skipping the Qt call if it would not move
         if self.duration > 0:
             slider_position = int((seconds / self.duration) * 1000)
-            self.timeline_slider.blockSignals(True)
-            self.timeline_slider.setValue(slider_position)
-            self.timeline_slider.blockSignals(False)
+            if slider_position != self.timeline_slider.value():
+                self.timeline_slider.blockSignals(True)
+                self.timeline_slider.setValue(slider_position)
+                self.timeline_slider.blockSignals(False)
+    
+    def _set_timecode_text(self, timecode: str):
+        """
+        Show a timecode in the position field if it differs from the current text
+        
+        Args:
+            timecode: Timecode to display
+        """
+        if timecode != self.current_timecode.text():
+            self.current_timecode.setText(timecode)
     
     def _open_in_external_player(self):
         """Open the video in the system's default media player"""
@@ -352,7 +688,6 @@ class PreviewPanel(QWidget):
             return
         
         try:
-            import os
             os.startfile(self.video_path)
         except Exception as e:
             QMessageBox.warning(
@@ -393,43 +728,105 @@ class PreviewPanel(QWidget):
         # Clamp to valid range
         seconds = max(0.0, min(seconds, self.duration))
         
-        # Calculate frame number
-        frame_number = int(seconds * self.fps)
-        
-        # Seek to frame
-        self.video_capture.set(cv2.CAP_PROP_POS_FRAMES, frame_number)
-        ret, frame = self.video_capture.read()
-        
-        if not ret:
-            self.status_label.setText(f"Error seeking to frame {frame_number}")
+        # The native player is on screen; move it and let it report the new position
+        if self._player_active:
+            self.media_player.setPosition(int(seconds * 1000))
             return
         
+        # Calculate frame number (the end of the video maps to the last frame)
+        frame_number = min(int(seconds * self.fps), self.total_frames - 1)
+        
         # Update current time
         self.current_time = seconds
+        self._continue_playback_from_current_time()
         
         # Update UI
         self._update_ui_for_time(seconds)
         
-        # Display the frame
+        # Decode in the background; the frame is shown by _on_frame_ready
+        if not self._suppress_frame_requests:
+            self._request_frame(frame_number)
+    
+    def _request_frame(self, frame_number: int):
+        """
+        Ask the background decoder for a frame to display
+        
+        Args:
+            frame_number: Frame to decode
+        """
+        if self._frame_worker is None:
+            return
+        
+        # Scrubbing back over a region reuses frames decoded moments ago
+        frame = self._frame_cache.get(frame_number)
+        if frame is not None:
+            self._frame_cache.move_to_end(frame_number)
+            self._requested_frame = None
+            self.preview_widget.display_frame(frame)
+            return
+        
+        self._requested_frame = frame_number
+        self._frame_worker.request_frame(frame_number)
+    
+    def _on_frame_ready(self, frame_number: int, frame):
+        """
+        Display a frame decoded by the background worker
+        
+        Args:
+            frame_number: Decoded frame number
+            frame: OpenCV frame, or None if decoding failed
+        """
+        # Drop results superseded by a newer request, a frame step or playback
+        # (scrub previews still show while the slider is held during playback)
+        if frame_number != self._requested_frame:
+            return
+        if self.is_playing and not self.timeline_slider.isSliderDown():
+            return
+        
+        self._requested_frame = None
+        
+        if frame is None:
+            self.status_label.setText(f"Error seeking to frame {frame_number}")
+            return
+        
+        # Add to cache
+        old_frame = self._frame_cache.pop(frame_number, None)
+        if old_frame is not None:
+            self._cache_bytes -= old_frame.nbytes
+        self._frame_cache[frame_number] = frame
+        self._cache_bytes += frame.nbytes
+        
+        # Evict the least recently used frames until back under budget
+        while self._cache_bytes > self._cache_byte_limit and len(self._frame_cache) > 1:
+            _, evicted = self._frame_cache.popitem(last=False)
+            self._cache_bytes -= evicted.nbytes
+        
         self.preview_widget.display_frame(frame)
     
     def _update_timecode_display(self):
         """Update the timecode display"""
         timecode = seconds_to_timecode(self.current_time)
-        self.current_timecode.setText(timecode)
+        self._set_timecode_text(timecode)
     
     def _slider_pressed(self):
         """Handle slider press event"""
+        # The release handler decodes the final position exactly once
+        self._suppress_frame_requests = True
+        
         # Pause playback while seeking
         was_playing = self.is_playing
         if was_playing:
-            self.playback_timer.stop()
+            self._stop_playback()
         
         # Store the state to resume after release if needed
         self.timeline_slider.setProperty("was_playing", was_playing)
     
     def _slider_released(self):
         """Handle slider release event"""
+        # The seek below supersedes any pending scrub preview
+        self._slider_preview_timer.stop()
+        self._suppress_frame_requests = False
+        
         # Get the time from the slider position
         position = self.timeline_slider.value()
         if self.duration > 0:
@@ -439,7 +836,7 @@ class PreviewPanel(QWidget):
         # Resume playback if it was playing before
         was_playing = self.timeline_slider.property("was_playing")
         if was_playing:
-            self.playback_timer.start()
+            self._start_playback()
             self.is_playing = True
             self.play_button.setIcon(self.style().standardIcon(QStyle.SP_MediaPause))
     
@@ -450,22 +847,26 @@ class PreviewPanel(QWidget):
         Args:
             position: New slider position (0-1000)
         """
+        # Remember the latest position; the timer previews it once per interval
+        self._pending_slider_position = position
+        if not self._slider_preview_timer.isActive():
+            self._slider_preview_timer.start()
+    
+    def _preview_slider_position(self):
+        """Preview the frame at the most recent slider position"""
+        position = self._pending_slider_position
+        
         # Preview the frame at the slider position
         if self.duration > 0 and self.video_capture:
             seconds = (position / 1000.0) * self.duration
-            frame_number = int(seconds * self.fps)
+            frame_number = min(int(seconds * self.fps), self.total_frames - 1)
             
-            # Seek to frame for preview
-            self.video_capture.set(cv2.CAP_PROP_POS_FRAMES, frame_number)
-            ret, frame = self.video_capture.read()
+            # Decode the frame for preview in the background
+            self._request_frame(frame_number)
             
-            if ret:
-                # Display the frame
-                self.preview_widget.display_frame(frame)
-                
-                # Update timecode display (without changing current_time)
-                if not self.current_timecode.hasFocus():
-                    self.current_timecode.setText(seconds_to_timecode(seconds))
+            # Update timecode display (without changing current_time)
+            if not self.current_timecode.hasFocus():
+                self._set_timecode_text(seconds_to_timecode(seconds))
     
     def _prev_frame(self):
         """Go to previous frame"""
@@ -476,14 +877,24 @@ class PreviewPanel(QWidget):
         current_frame = int(self.current_time * self.fps)
         prev_frame = max(0, current_frame - 1)
         
+        # While the native player is on screen, step it instead of decoding a hidden frame
+        if self._player_active:
+            if prev_frame != current_frame:
+                self._seek_to_time(prev_frame / self.fps)
+            return
+        
         if prev_frame != current_frame:
             # Seek to previous frame
             self.video_capture.set(cv2.CAP_PROP_POS_FRAMES, prev_frame)
             ret, frame = self.video_capture.read()
             
             if ret:
+                # A frame step supersedes any pending background decode
+                self._requested_frame = None
+                
                 # Update current time
                 self.current_time = prev_frame / self.fps
+                self._continue_playback_from_current_time()
                 
                 # Update UI
                 self._update_ui_for_time(self.current_time)
@@ -500,14 +911,24 @@ class PreviewPanel(QWidget):
         current_frame = int(self.current_time * self.fps)
         next_frame = min(current_frame + 1, self.total_frames - 1)
         
+        # While the native player is on screen, step it instead of decoding a hidden frame
+        if self._player_active:
+            if next_frame != current_frame:
+                self._seek_to_time(next_frame / self.fps)
+            return
+        
         if next_frame != current_frame:
             # Seek to next frame
             self.video_capture.set(cv2.CAP_PROP_POS_FRAMES, next_frame)
             ret, frame = self.video_capture.read()
             
             if ret:
+                # A frame step supersedes any pending background decode
+                self._requested_frame = None
+                
                 # Update current time
                 self.current_time = next_frame / self.fps
+                self._continue_playback_from_current_time()
                 
                 # Update UI
                 self._update_ui_for_time(self.current_time)
@@ -2,21 +2,177 @@
 Panel for managing video trim segments
 """
 import re
-from typing import Dict, List, Optional
+import logging
+from typing import Dict, List, Optional, Tuple
 from PyQt5.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
-    QLineEdit, QDoubleSpinBox, QComboBox, QScrollArea,
+    QLineEdit, QComboBox, QScrollArea,
     QGroupBox, QFormLayout, QMessageBox, QFrame, QDialog,
     QDialogButtonBox, QInputDialog, QListWidget, QStyle,
     QToolButton, QGridLayout
 )
-from PyQt5.QtCore import Qt, pyqtSignal, QRegExp
-from PyQt5.QtGui import QRegExpValidator, QIcon
+from PyQt5.QtCore import Qt, pyqtSignal, QSignalBlocker, QTimer, QEvent, QLocale
+from PyQt5.QtGui import QValidator, QDoubleValidator, QIcon
 
 from models.video_segment import VideoSegment
 from utils.config_manager import ConfigManager
 from services.timecode_utils import validate_timecode, timecode_to_seconds, seconds_to_timecode
 
+logger = logging.getLogger(__name__)
+
+# Standard style icons, looked up once on first use
+_STANDARD_ICONS: Dict[int, QIcon] = {}
+
+
+def _standard_icon(widget: QWidget, pixmap: int) -> QIcon:
+    """
+    Get a cached standard icon
+    
+    Args:
+        widget: Widget whose style provides the icon on first lookup
+        pixmap: QStyle.StandardPixmap value
+        
+    Returns:
+        QIcon: The icon
+    """
+    icon = _STANDARD_ICONS.get(pixmap)
+    if icon is None:
+        icon = widget.style().standardIcon(pixmap)
+        _STANDARD_ICONS[pixmap] = icon
+    return icon
+
+
+def _format_preset_label(preset: Dict) -> str:
+    """
+    Format the display label for a fade preset
+    
+    Args:
+        preset: Fade preset dictionary
+        
+    Returns:
+        str: Label in the form "Name (In: 0.5s, Out: 0.5s)"
+    """
+    name = preset.get("name", "Unknown")
+    fade_in = preset.get("in", 0.0)
+    fade_out = preset.get("out", 0.0)
+    return f"{name} (In: {fade_in}s, Out: {fade_out}s)"
+
+
+def _index_presets_by_fades(presets: List[Dict]) -> Dict[Tuple, int]:
+    """
+    Map (fade in, fade out) pairs to preset combo indices
+    
+    Args:
+        presets: List of fade presets
+        
+    Returns:
+        dict: Combo box index (offset by the leading "Custom" item) per fade pair
+    """
+    return {(preset.get("in"), preset.get("out")): i + 1 for i, preset in enumerate(presets)}
+
+
+class TimecodeValidator(QValidator):
+    """Validator for HH:MM:SS timecodes with optional [:.]mmm milliseconds"""
+    
+    # Character expected at each position; "d" is a digit
+    _SHAPE = "dd:dd:dd"
+    _MAX_LENGTH = 12
+    
+    def validate(self, text, pos):
+        """
+        Check the input position by position
+        
+        Args:
+            text: Current input
+            pos: Cursor position
+            
+        Returns:
+            tuple: (state, text, pos) where state is Acceptable for a complete
+                   timecode, Intermediate for a valid prefix, Invalid otherwise
+        """
+        length = len(text)
+        if length > self._MAX_LENGTH:
+            return QValidator.Invalid, text, pos
+        
+        for i, char in enumerate(text):
+            if i < 8:
+                expected = self._SHAPE[i]
+                ok = char.isdecimal() if expected == "d" else char == expected
+            elif i == 8:
+                ok = char in ":."
+            else:
+                ok = char.isdecimal()
+            if not ok:
+                return QValidator.Invalid, text, pos
+        
+        if length == 8 or length >= 10:
+            return QValidator.Acceptable, text, pos
+        return QValidator.Intermediate, text, pos
+
+
+class DoubleLineEdit(QLineEdit):
+    """Line edit for a bounded decimal value, a lighter stand-in for QDoubleSpinBox"""
+    
+    def __init__(self, value=0.0, minimum=0.0, maximum=10.0, decimals=2, parent=None):
+        """
+        Initialize the line edit
+        
+        Args:
+            value: Initial value
+            minimum: Smallest accepted value
+            maximum: Largest accepted value
+            decimals: Number of decimals shown and accepted
+            parent: Parent widget
+        """
+        super().__init__(parent)
+        
+        self._minimum = minimum
+        self._maximum = maximum
+        self._decimals = decimals
+        
+        validator = QDoubleValidator(minimum, maximum, decimals, self)
+        validator.setNotation(QDoubleValidator.StandardNotation)
+        validator.setLocale(QLocale.c())
+        self.setValidator(validator)
+        
+        self._value = minimum
+        self.setValue(value)
+        self.editingFinished.connect(self.commit)
+    
+    def value(self) -> float:
+        """
+        Get the current value
+        
+        Returns:
+            float: Typed value if acceptable, otherwise the last committed value
+        """
+        if self.hasAcceptableInput():
+            value, ok = self.validator().locale().toDouble(self.text())
+            if ok:
+                return value
+        return self._value
+    
+    def setValue(self, value: float) -> None:
+        """
+        Set the value, clamped to the range and rounded to the decimals
+        
+        Args:
+            value: New value
+        """
+        value = round(min(max(float(value), self._minimum), self._maximum), self._decimals)
+        self._value = value
+        self.setText(f"{value:.{self._decimals}f}")
+    
+    def commit(self) -> None:
+        """Commit and normalize the typed value"""
+        self.setValue(self.value())
+    
+    def focusOutEvent(self, event):
+        """Restore the last committed value if the input was left incomplete"""
+        if not self.hasAcceptableInput():
+            self.setValue(self._value)
+        super().focusOutEvent(event)
+
 
 class TimeAdjustWidget(QWidget):
     """Widget for adjusting timecode with buttons for hours, minutes, and seconds"""
@@ -24,17 +180,19 @@ class TimeAdjustWidget(QWidget):
     # Signal when time is changed
     time_changed = pyqtSignal(str)
     
-    def __init__(self, initial_time="00:00:00", parent=None):
+    def __init__(self, initial_time="00:00:00", validator: Optional[QValidator] = None, parent=None):
         """
         Initialize the time adjust widget
         
         Args:
             initial_time: Initial timecode in HH:MM:SS format
+            validator: Shared timecode validator, a private one is made if omitted
             parent: Parent widget
         """
         super().__init__(parent)
         
         self.timecode = initial_time
+        self._validator = validator
         self._setup_ui()
     
     def _setup_ui(self):
@@ -45,7 +203,9 @@ class TimeAdjustWidget(QWidget):
         
         # Time display
         self.time_edit = QLineEdit(self.timecode)
-        self.time_edit.setValidator(QRegExpValidator(QRegExp(r'\d{2}:\d{2}:\d{2}(?:[:.]\d{1,3})?')))
+        if self._validator is None:
+            self._validator = TimecodeValidator(self)
+        self.time_edit.setValidator(self._validator)
         self.time_edit.setPlaceholderText("HH:MM:SS")
         self.time_edit.textChanged.connect(self._on_time_edited)
         layout.addWidget(self.time_edit, 1, 0, 1, 6)  # Span across all columns
@@ -141,7 +301,7 @@ class TimeAdjustWidget(QWidget):
             # Emit signal
             self.time_changed.emit(self.timecode)
         except Exception as e:
-            print(f"Error adjusting time: {str(e)}")
+            logger.warning("Error adjusting time: %s", e)
     
     def set_time(self, timecode):
         """
@@ -172,13 +332,19 @@ class SegmentWidget(QGroupBox):
     seek_start_clicked = pyqtSignal(str)  # Signal when seek to start clicked
     seek_end_clicked = pyqtSignal(str)  # Signal when seek to end clicked
     
-    def __init__(self, segment: VideoSegment, presets: List[Dict], parent=None):
+    def __init__(self, segment: VideoSegment, presets: List[Dict],
+                 preset_labels: Optional[List[str]] = None,
+                 preset_index_by_fades: Optional[Dict[Tuple, int]] = None,
+                 timecode_validator: Optional[QValidator] = None, parent=None):
         """
         Initialize a segment widget
         
         Args:
             segment: VideoSegment to represent
             presets: List of fade presets
+            preset_labels: Precomputed display labels for the presets
+            preset_index_by_fades: Combo index keyed by (fade in, fade out)
+            timecode_validator: Shared validator for the start and end fields
             parent: Parent widget
         """
         # Ensure segment has a valid name
@@ -193,6 +359,25 @@ class SegmentWidget(QGroupBox):
         
         self.segment = segment
         self.presets = presets if isinstance(presets, list) else []
+        if preset_labels is None:
+            preset_labels = [_format_preset_label(preset) for preset in self.presets]
+        self.preset_labels = preset_labels
+        if preset_index_by_fades is None:
+            preset_index_by_fades = _index_presets_by_fades(self.presets)
+        self.preset_index_by_fades = preset_index_by_fades
+        self.timecode_validator = timecode_validator
+        
+        # Position in the owning TrimPanel's segment list
+        self.segment_index = -1
+        
+        # Displayed duration in tenths of a second, to skip identical updates
+        self._last_duration_tenths: Optional[int] = None
+        
+        # Coalesce bursts of edits (typing, held arrow buttons) into one update
+        self._update_timer = QTimer(self)
+        self._update_timer.setSingleShot(True)
+        self._update_timer.setInterval(80)
+        self._update_timer.timeout.connect(self._update_segment)
         
         self._setup_ui()
     
@@ -204,13 +389,13 @@ class SegmentWidget(QGroupBox):
         name_str = self.segment.name if hasattr(self.segment, 'name') and self.segment.name else ""
         self.name_edit = QLineEdit(name_str)
         self.name_edit.setPlaceholderText("Segment name (optional)")
-        self.name_edit.textChanged.connect(self._update_segment_name)
+        self.name_edit.textChanged.connect(self._schedule_update)
         layout.addRow("Name:", self.name_edit)
         
         # Start time with adjustment buttons
         start_time_str = str(self.segment.start_time) if hasattr(self.segment, 'start_time') else "00:00:00"
-        self.start_time_widget = TimeAdjustWidget(start_time_str)
-        self.start_time_widget.time_changed.connect(self._update_segment)
+        self.start_time_widget = TimeAdjustWidget(start_time_str, self.timecode_validator)
+        self.start_time_widget.time_changed.connect(self._schedule_update)
         
         start_layout = QHBoxLayout()
         start_layout.addWidget(self.start_time_widget)
@@ -219,15 +404,15 @@ class SegmentWidget(QGroupBox):
         seek_start_btn = QPushButton("⏺")
         seek_start_btn.setToolTip("Seek to start time")
         seek_start_btn.setMaximumWidth(30)
-        seek_start_btn.clicked.connect(lambda: self.seek_start_clicked.emit(self.start_time_widget.get_time()))
+        seek_start_btn.clicked.connect(self._emit_seek_start)
         start_layout.addWidget(seek_start_btn)
         
         layout.addRow("Start:", start_layout)
         
         # End time with adjustment buttons
         end_time_str = str(self.segment.end_time) if hasattr(self.segment, 'end_time') else "00:00:10"
-        self.end_time_widget = TimeAdjustWidget(end_time_str)
-        self.end_time_widget.time_changed.connect(self._update_segment)
+        self.end_time_widget = TimeAdjustWidget(end_time_str, self.timecode_validator)
+        self.end_time_widget.time_changed.connect(self._schedule_update)
         
         end_layout = QHBoxLayout()
         end_layout.addWidget(self.end_time_widget)
@@ -236,7 +421,7 @@ class SegmentWidget(QGroupBox):
         seek_end_btn = QPushButton("⏺")
         seek_end_btn.setToolTip("Seek to end time")
         seek_end_btn.setMaximumWidth(30)
-        seek_end_btn.clicked.connect(lambda: self.seek_end_clicked.emit(self.end_time_widget.get_time()))
+        seek_end_btn.clicked.connect(self._emit_seek_end)
         end_layout.addWidget(seek_end_btn)
         
         layout.addRow("End:", end_layout)
@@ -262,31 +447,25 @@ class SegmentWidget(QGroupBox):
         fade_layout = QHBoxLayout()
         
         # Fade in
-        self.fade_in = QDoubleSpinBox()
-        self.fade_in.setRange(0, 10)
-        self.fade_in.setSingleStep(0.1)
+        self.fade_in = DoubleLineEdit()
         try:
             fade_in_value = float(self.segment.fade_in_duration) if hasattr(self.segment, 'fade_in_duration') else 0.5
             self.fade_in.setValue(fade_in_value)
         except (ValueError, TypeError):
             self.fade_in.setValue(0.5)
-        self.fade_in.setSuffix(" sec")
-        self.fade_in.valueChanged.connect(self._update_segment)
-        fade_layout.addWidget(QLabel("In:"))
+        self.fade_in.editingFinished.connect(self._update_segment)
+        fade_layout.addWidget(QLabel("In (sec):"))
         fade_layout.addWidget(self.fade_in)
         
         # Fade out
-        self.fade_out = QDoubleSpinBox()
-        self.fade_out.setRange(0, 10)
-        self.fade_out.setSingleStep(0.1)
+        self.fade_out = DoubleLineEdit()
         try:
             fade_out_value = float(self.segment.fade_out_duration) if hasattr(self.segment, 'fade_out_duration') else 0.5
             self.fade_out.setValue(fade_out_value)
         except (ValueError, TypeError):
             self.fade_out.setValue(0.5)
-        self.fade_out.setSuffix(" sec")
-        self.fade_out.valueChanged.connect(self._update_segment)
-        fade_layout.addWidget(QLabel("Out:"))
+        self.fade_out.editingFinished.connect(self._update_segment)
+        fade_layout.addWidget(QLabel("Out (sec):"))
         fade_layout.addWidget(self.fade_out)
         
         layout.addRow("Fade Durations:", fade_layout)
@@ -302,7 +481,7 @@ class SegmentWidget(QGroupBox):
         
         # Remove button
         remove_button = QPushButton("Remove Segment")
-        remove_button.clicked.connect(lambda: self.remove_clicked.emit(self))
+        remove_button.clicked.connect(self._emit_remove)
         buttons_layout.addWidget(remove_button)
         
         # Preview button
@@ -314,19 +493,15 @@ class SegmentWidget(QGroupBox):
     
     def _populate_presets(self):
         """Populate the presets combo box"""
-        self.preset_combo.clear()
-        self.preset_combo.addItem("Custom")
-        
-        for preset in self.presets:
-            name = preset.get("name", "Unknown")
-            fade_in = preset.get("in", 0.0)
-            fade_out = preset.get("out", 0.0)
-            self.preset_combo.addItem(f"{name} (In: {fade_in}s, Out: {fade_out}s)")
+        # Rebuilding the list must not re-apply a preset to the segment
+        with QSignalBlocker(self.preset_combo):
+            self.preset_combo.clear()
+            self.preset_combo.addItem("Custom")
+            self.preset_combo.addItems(self.preset_labels)
             
-            # Select if matches current fade settings
-            if (preset.get("in") == self.segment.fade_in_duration and 
-                preset.get("out") == self.segment.fade_out_duration):
-                self.preset_combo.setCurrentText(f"{name} (In: {fade_in}s, Out: {fade_out}s)")
+            # Select if matches current fade settings, otherwise "Custom"
+            fades = (self.segment.fade_in_duration, self.segment.fade_out_duration)
+            self.preset_combo.setCurrentIndex(self.preset_index_by_fades.get(fades, 0))
     
     def _on_preset_changed(self, index):
         """Handle preset selection change"""
@@ -335,13 +510,23 @@ class SegmentWidget(QGroupBox):
         
         preset = self.presets[index - 1]  # -1 because "Custom" is at index 0
         
+        # Programmatic values do not emit editingFinished; update the segment once
         self.fade_in.setValue(preset.get("in", 0.0))
         self.fade_out.setValue(preset.get("out", 0.0))
         
         self._update_segment()
     
+    def _schedule_update(self, *args):
+        """Restart the coalescing timer after an edit"""
+        self._update_timer.start()
+    
     def _update_segment(self):
         """Update the segment with current values"""
+        # Any pending coalesced update is covered by this one
+        self._update_timer.stop()
+        
+        self._update_segment_name()
+        
         # Get timecodes from widgets
         start_time = self.start_time_widget.get_time()
         end_time = self.end_time_widget.get_time()
@@ -361,9 +546,13 @@ class SegmentWidget(QGroupBox):
     def _update_duration_display(self):
         """Update the duration display label"""
         try:
-            duration = self.segment.duration
-            self.duration_label.setText(f"{duration:.1f} seconds")
+            tenths = round(self.segment.duration * 10)
+            if tenths == self._last_duration_tenths:
+                return
+            self._last_duration_tenths = tenths
+            self.duration_label.setText(f"{tenths / 10:.1f} seconds")
         except Exception:
+            self._last_duration_tenths = None
             self.duration_label.setText("Invalid duration")
     
     def _update_segment_name(self):
@@ -375,6 +564,18 @@ class SegmentWidget(QGroupBox):
         title = name if name else "Segment"
         self.setTitle(title)
     
+    def _emit_seek_start(self):
+        """Request a seek to the start time"""
+        self.seek_start_clicked.emit(self.start_time_widget.get_time())
+    
+    def _emit_seek_end(self):
+        """Request a seek to the end time"""
+        self.seek_end_clicked.emit(self.end_time_widget.get_time())
+    
+    def _emit_remove(self):
+        """Request removal of this segment"""
+        self.remove_clicked.emit(self)
+    
     def _preview_segment(self):
         """Preview this segment by setting the preview to the start time"""
         self.seek_start_clicked.emit(self.start_time_widget.get_time())
@@ -386,6 +587,15 @@ class SegmentWidget(QGroupBox):
         Returns:
             VideoSegment: The current segment
         """
+        # Apply fade text typed but not yet committed, and edits still
+        # waiting on the coalescing timer
+        if self.fade_in.isModified() or self.fade_out.isModified():
+            self.fade_in.commit()
+            self.fade_out.commit()
+            self._update_segment()
+        elif self._update_timer.isActive():
+            self._update_segment()
+        
         return self.segment
 
 
@@ -408,11 +618,23 @@ class TrimPanel(QWidget):
         super().__init__(parent)
         
         self.config_manager = config_manager
-        self.segment_widgets: List[SegmentWidget] = []
         self.enabled = True
         
+        # Segments are the source of truth; widgets only exist for the rows
+        # in or near the viewport, keyed by segment index
+        self.segment_models: List[VideoSegment] = []
+        self.segment_widgets: Dict[int, SegmentWidget] = {}
+        self._slot_height: Optional[int] = None  # Measured from the first widget
+        self._segment_spacing = 10
+        self._bulk_add_depth = 0  # Row refresh is deferred while > 0
+        
         # Load fade presets
         self.fade_presets = self.config_manager.get_preset_fades()
+        self._refresh_preset_labels()
+        self._presets_dirty = False
+        
+        # One timecode validator shared by every segment's time fields
+        self._timecode_validator = TimecodeValidator(self)
         
         self._setup_ui()
     
@@ -431,13 +653,13 @@ class TrimPanel(QWidget):
         
         # Add Segment button
         self.add_button = QPushButton("Add Segment")
-        self.add_button.setIcon(self.style().standardIcon(QStyle.SP_FileDialogNewFolder))
+        self.add_button.setIcon(_standard_icon(self, QStyle.SP_FileDialogNewFolder))
         self.add_button.clicked.connect(self.add_segment)
         top_controls.addWidget(self.add_button)
         
         # Fade presets management
         preset_button = QPushButton("Manage Fade Presets")
-        preset_button.setIcon(self.style().standardIcon(QStyle.SP_FileDialogDetailedView))
+        preset_button.setIcon(_standard_icon(self, QStyle.SP_FileDialogDetailedView))
         preset_button.clicked.connect(self._manage_presets)
         top_controls.addWidget(preset_button)
         
@@ -455,17 +677,26 @@ class TrimPanel(QWidget):
         layout.addWidget(instructions)
         
         # Scroll area for segments
-        scroll_area = QScrollArea()
-        scroll_area.setWidgetResizable(True)
-        scroll_area.setFrameShape(QFrame.NoFrame)
+        self.scroll_area = QScrollArea()
+        self.scroll_area.setWidgetResizable(True)
+        self.scroll_area.setFrameShape(QFrame.NoFrame)
         
+        # Segment widgets are positioned manually in fixed-height rows
         self.segments_container = QWidget()
-        self.segments_layout = QVBoxLayout(self.segments_container)
-        self.segments_layout.setAlignment(Qt.AlignTop)
-        self.segments_layout.setSpacing(10)
         
-        scroll_area.setWidget(self.segments_container)
-        layout.addWidget(scroll_area, 1)  # Give the scroll area all available space
+        self.scroll_area.setWidget(self.segments_container)
+        layout.addWidget(self.scroll_area, 1)  # Give the scroll area all available space
+        
+        # Realize the rows that come into view when scrolling or resizing
+        self.scroll_area.verticalScrollBar().valueChanged.connect(self._update_visible_segments)
+        self.scroll_area.viewport().installEventFilter(self)
+        self.segments_container.installEventFilter(self)
+    
+    def eventFilter(self, obj, event):
+        """Refresh the realized rows when the viewport or container is resized"""
+        if event.type() == QEvent.Resize:
+            self._update_visible_segments()
+        return super().eventFilter(obj, event)
     
     def set_enabled(self, enabled: bool):
         """
@@ -477,7 +708,7 @@ class TrimPanel(QWidget):
         self.enabled = enabled
         self.add_button.setEnabled(enabled)
         
-        for widget in self.segment_widgets:
+        for widget in self.segment_widgets.values():
             widget.setEnabled(enabled)
     
     def add_segment(self, start_time="00:00:00", end_time="00:00:10"):
@@ -509,7 +740,7 @@ class TrimPanel(QWidget):
             fade_out = 0.5
         
         # Create a new segment
-        segment_count = len(self.segment_widgets) + 1
+        segment_count = len(self.segment_models) + 1
         segment = VideoSegment(
             start_time=start_time,
             end_time=end_time,
@@ -518,26 +749,157 @@ class TrimPanel(QWidget):
             name=f"Segment {segment_count}"
         )
         
-        # Create and add the widget
-        widget = SegmentWidget(segment, self.fade_presets)
+        self._append_segments([segment])
+    
+    def add_segments(self, segments: List[VideoSegment]):
+        """
+        Add several existing segments with a single relayout
+        
+        Args:
+            segments: Segments to add, in order
+        """
+        if not self.enabled:
+            return
+        
+        for i, segment in enumerate(segments):
+            if not segment.name:
+                segment.name = f"Segment {len(self.segment_models) + i + 1}"
+        
+        self._append_segments(segments)
+    
+    def begin_bulk_add(self):
+        """
+        Defer relayout and repaint while many segments are added
+        
+        Callers loading a project should wrap their add_segment/add_segments
+        calls between begin_bulk_add() and end_bulk_add(). Calls may nest.
+        """
+        if not self._bulk_add_depth:
+            self.segments_container.setUpdatesEnabled(False)
+        self._bulk_add_depth += 1
+    
+    def end_bulk_add(self):
+        """Finish a bulk add and refresh the segment rows once"""
+        if not self._bulk_add_depth:
+            return
+        
+        self._bulk_add_depth -= 1
+        if self._bulk_add_depth:
+            return
+        
+        self._update_container_height()
+        self._update_visible_segments()
+        self.segments_container.setUpdatesEnabled(True)
+    
+    def _append_segments(self, segments: List[VideoSegment]):
+        """
+        Store segments, refresh the visible rows once and announce them
+        
+        Args:
+            segments: Segments to add, in order
+        """
+        self.segment_models.extend(segments)
+        if not self._bulk_add_depth:
+            self._update_container_height()
+            self._update_visible_segments()
+        
+        # Emit the signal
+        for segment in segments:
+            self.segment_added.emit(segment)
+    
+    def _update_container_height(self):
+        """Size the container to hold a row for every segment"""
+        if self._slot_height is None:
+            height = 0
+        else:
+            height = len(self.segment_models) * (self._slot_height + self._segment_spacing)
+        self.segments_container.setMinimumHeight(height)
+    
+    def _update_visible_segments(self):
+        """Create widgets for rows in or near the viewport and release the rest"""
+        count = len(self.segment_models)
+        
+        # The first widget provides the row height for all segments
+        if count and self._slot_height is None:
+            self._realize_segment(0)
+            self._update_container_height()
+        
+        if self._slot_height is None:
+            visible = range(0)
+        else:
+            pitch = self._slot_height + self._segment_spacing
+            top = self.scroll_area.verticalScrollBar().value()
+            height = self.scroll_area.viewport().height()
+            
+            # Keep one extra row above and below to avoid blank edges while scrolling
+            first = max(0, top // pitch - 1)
+            last = min(count, (top + height) // pitch + 2)
+            visible = range(first, last)
+        
+        for index in [i for i in self.segment_widgets if i not in visible]:
+            self._unrealize_segment(index)
+        
+        width = self.segments_container.width()
+        for index in visible:
+            widget = self.segment_widgets.get(index)
+            if widget is None:
+                widget = self._realize_segment(index)
+            widget.setGeometry(0, index * pitch, width, self._slot_height)
+    
+    def _realize_segment(self, index: int) -> SegmentWidget:
+        """
+        Create the widget for a segment row
+        
+        Args:
+            index: Segment index
+            
+        Returns:
+            SegmentWidget: The new widget
+        """
+        widget = SegmentWidget(
+            self.segment_models[index],
+            self.fade_presets,
+            self._preset_labels,
+            self._preset_index_by_fades,
+            self._timecode_validator,
+            parent=self.segments_container
+        )
         widget.remove_clicked.connect(self._remove_segment)
         widget.seek_start_clicked.connect(self.segment_seek_requested)
         widget.seek_end_clicked.connect(self.segment_seek_requested)
+        widget.segment_index = index
+        widget.setEnabled(self.enabled)
         
-        self.segments_layout.addWidget(widget)
-        self.segment_widgets.append(widget)
+        if self._slot_height is None:
+            self._slot_height = widget.sizeHint().height()
         
-        # Emit the signal
-        self.segment_added.emit(segment)
+        widget.show()
+        self.segment_widgets[index] = widget
+        return widget
+    
+    def _unrealize_segment(self, index: int):
+        """
+        Release the widget for a segment row that scrolled out of view
+        
+        Args:
+            index: Segment index
+        """
+        widget = self.segment_widgets.pop(index)
+        
+        # Apply pending edits, including uncommitted fade text, to the model
+        # before the widget goes away
+        widget.get_segment()
+        widget.deleteLater()
     
     def clear_segments(self):
         """Remove all segments"""
         # Remove all widgets
-        for widget in self.segment_widgets:
-            self.segments_layout.removeWidget(widget)
+        for widget in self.segment_widgets.values():
             widget.deleteLater()
         
         self.segment_widgets.clear()
+        self.segment_models.clear()
+        self._update_container_height()
     
     def _remove_segment(self, widget: SegmentWidget):
         """
@@ -546,23 +908,41 @@ class TrimPanel(QWidget):
         Args:
             widget: The widget to remove
         """
-        # Find the index
-        index = self.segment_widgets.index(widget)
+        # Use the stored index instead of searching the list
+        index = widget.segment_index
         
-        # Remove the widget
-        self.segments_layout.removeWidget(widget)
-        self.segment_widgets.remove(widget)
+        # Remove the widget and its model
+        del self.segment_widgets[index]
+        del self.segment_models[index]
         widget.deleteLater()
         
+        # Shift the indices of the realized widgets that followed it
+        self.segment_widgets = {
+            (i - 1 if i > index else i): w for i, w in self.segment_widgets.items()
+        }
+        for i, w in self.segment_widgets.items():
+            w.segment_index = i
+        
+        self._update_container_height()
+        self._update_visible_segments()
+        
         # Emit the signal
         self.segment_removed.emit(index)
     
+    def _refresh_preset_labels(self):
+        """Rebuild the cached preset labels and lookup after the presets change"""
+        self._preset_labels = [_format_preset_label(preset) for preset in self.fade_presets]
+        self._preset_index_by_fades = _index_presets_by_fades(self.fade_presets)
+    
     def _manage_presets(self):
         """Open dialog to manage fade presets"""
         dialog = QDialog(self)
         dialog.setWindowTitle("Manage Fade Presets")
         dialog.setMinimumWidth(400)
         
+        # Set by add/edit/remove; presets are saved once when the dialog closes
+        self._presets_dirty = False
+        
         layout = QVBoxLayout(dialog)
         
         # Instructions
@@ -572,8 +952,7 @@ class TrimPanel(QWidget):
         
         # List of presets
         preset_list = QListWidget()
-        for preset in self.fade_presets:
-            preset_list.addItem(f"{preset.get('name')} (In: {preset.get('in', 0)}s, Out: {preset.get('out', 0)}s)")
+        preset_list.addItems(self._preset_labels)
         
         layout.addWidget(preset_list)
         
@@ -602,9 +981,17 @@ class TrimPanel(QWidget):
         # Show dialog
         dialog.exec_()
         
+        if not self._presets_dirty:
+            return
+        
+        # Save to config
+        self.config_manager.set("preset_fades", self.fade_presets)
+        
         # Update all segment widgets with new presets
-        for widget in self.segment_widgets:
+        for widget in self.segment_widgets.values():
             widget.presets = self.fade_presets
+            widget.preset_labels = self._preset_labels
+            widget.preset_index_by_fades = self._preset_index_by_fades
             widget._populate_presets()
     
     def _add_preset(self, preset_list):
@@ -620,20 +1007,12 @@ class TrimPanel(QWidget):
         form_layout.addRow("Name:", name_edit)
         
         # Fade in duration
-        fade_in_edit = QDoubleSpinBox()
-        fade_in_edit.setRange(0, 10)
-        fade_in_edit.setSingleStep(0.1)
-        fade_in_edit.setValue(0.5)
-        fade_in_edit.setSuffix(" sec")
-        form_layout.addRow("Fade In:", fade_in_edit)
+        fade_in_edit = DoubleLineEdit(0.5)
+        form_layout.addRow("Fade In (sec):", fade_in_edit)
         
         # Fade out duration
-        fade_out_edit = QDoubleSpinBox()
-        fade_out_edit.setRange(0, 10)
-        fade_out_edit.setSingleStep(0.1)
-        fade_out_edit.setValue(0.5)
-        fade_out_edit.setSuffix(" sec")
-        form_layout.addRow("Fade Out:", fade_out_edit)
+        fade_out_edit = DoubleLineEdit(0.5)
+        form_layout.addRow("Fade Out (sec):", fade_out_edit)
         
         layout.addLayout(form_layout)
         
@@ -658,10 +1037,9 @@ class TrimPanel(QWidget):
                 }
                 
                 self.fade_presets.append(new_preset)
-                preset_list.addItem(f"{name} (In: {fade_in}s, Out: {fade_out}s)")
-                
-                # Save to config
-                self.config_manager.set("preset_fades", self.fade_presets)
+                self._refresh_preset_labels()
+                preset_list.addItem(self._preset_labels[-1])
+                self._presets_dirty = True
     
     def _edit_preset(self, preset_list):
         """Edit a fade preset"""
@@ -684,20 +1062,12 @@ class TrimPanel(QWidget):
         form_layout.addRow("Name:", name_edit)
         
         # Fade in duration
-        fade_in_edit = QDoubleSpinBox()
-        fade_in_edit.setRange(0, 10)
-        fade_in_edit.setSingleStep(0.1)
-        fade_in_edit.setValue(preset.get("in", 0.5))
-        fade_in_edit.setSuffix(" sec")
-        form_layout.addRow("Fade In:", fade_in_edit)
+        fade_in_edit = DoubleLineEdit(preset.get("in", 0.5))
+        form_layout.addRow("Fade In (sec):", fade_in_edit)
         
         # Fade out duration
-        fade_out_edit = QDoubleSpinBox()
-        fade_out_edit.setRange(0, 10)
-        fade_out_edit.setSingleStep(0.1)
-        fade_out_edit.setValue(preset.get("out", 0.5))
-        fade_out_edit.setSuffix(" sec")
-        form_layout.addRow("Fade Out:", fade_out_edit)
+        fade_out_edit = DoubleLineEdit(preset.get("out", 0.5))
+        form_layout.addRow("Fade Out (sec):", fade_out_edit)
         
         layout.addLayout(form_layout)
         
@@ -721,11 +1091,11 @@ class TrimPanel(QWidget):
                     "out": fade_out
                 }
                 
-                # Update list item
-                preset_list.item(selected_index).setText(f"{name} (In: {fade_in}s, Out: {fade_out}s)")
+                self._refresh_preset_labels()
                 
-                # Save to config
-                self.config_manager.set("preset_fades", self.fade_presets)
+                # Update list item
+                preset_list.item(selected_index).setText(self._preset_labels[selected_index])
+                self._presets_dirty = True
     
     def _remove_preset(self, preset_list):
         """Remove a fade preset"""
@@ -746,10 +1116,9 @@ class TrimPanel(QWidget):
         if confirm == QMessageBox.Yes:
             # Remove preset
             del self.fade_presets[selected_index]
+            self._refresh_preset_labels()
             preset_list.takeItem(selected_index)
-            
-            # Save to config
-            self.config_manager.set("preset_fades", self.fade_presets)
+            self._presets_dirty = True
     
     def get_all_segments(self) -> List[VideoSegment]:
         """
@@ -758,4 +1127,8 @@ class TrimPanel(QWidget):
         Returns:
             List[VideoSegment]: List of all segments
         """
-        return [widget.get_segment() for widget in self.segment_widgets]
+        # Apply pending edits from the realized widgets to their models
+        for widget in self.segment_widgets.values():
+            widget.get_segment()
+        
+        return list(self.segment_models)
@@ -3,42 +3,109 @@ Configuration manager for saving and loading application settings
 """
 import os
 import json
-from typing import Any, Dict, List, Optional
+import atexit
+import hashlib
+import weakref
+from collections import deque
+from types import MappingProxyType
+from typing import Any, Callable, Deque, Dict, List, Optional, Set
 
-# Default configuration values
-DEFAULT_CONFIG = {
-    "recent_files": [],
+# orjson is optional; it parses and serializes noticeably faster than json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _loads(data: bytes) -> Any:
+    """Parse JSON bytes, preferring orjson when available"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _dumps(obj: Any) -> bytes:
+    """Serialize to indented JSON bytes, preferring orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode("utf-8")
+
+
+# Default configuration values, read-only at every level (nested lists are
+# tuples and nested dicts are mapping proxies)
+DEFAULT_CONFIG = MappingProxyType({
+    "recent_files": (),
     "max_recent_files": 5,
     "output_directory": "",
     "default_fade_in": 0.5,
     "default_fade_out": 0.5,
-    "preset_fades": [
-        {"name": "None", "in": 0.0, "out": 0.0},
-        {"name": "Gentle", "in": 0.5, "out": 0.5},
-        {"name": "Smooth", "in": 1.0, "out": 1.0},
-        {"name": "Dramatic", "in": 0.0, "out": 2.0},
-        {"name": "Intro", "in": 2.0, "out": 0.0}
-    ]
-}
+    "preset_fades": (
+        MappingProxyType({"name": "None", "in": 0.0, "out": 0.0}),
+        MappingProxyType({"name": "Gentle", "in": 0.5, "out": 0.5}),
+        MappingProxyType({"name": "Smooth", "in": 1.0, "out": 1.0}),
+        MappingProxyType({"name": "Dramatic", "in": 0.0, "out": 2.0}),
+        MappingProxyType({"name": "Intro", "in": 2.0, "out": 0.0})
+    )
+})
+
+# Serialized once so every caller gets an independent, mutable deep copy
+_DEFAULT_TEMPLATE = json.dumps(DEFAULT_CONFIG, default=dict)
+
+
+def _default_config() -> Dict[str, Any]:
+    """Return a fresh deep copy of the default configuration"""
+    return json.loads(_DEFAULT_TEMPLATE)
+
+
+def _flush_at_exit(manager_ref: "weakref.ref[ConfigManager]") -> None:
+    """Flush a configuration manager at exit if it is still alive"""
+    manager = manager_ref()
+    if manager is not None:
+        manager.flush()
+
+
+def _digest(data: bytes) -> bytes:
+    """Return a short digest of serialized configuration bytes"""
+    return hashlib.blake2b(data, digest_size=16).digest()
 
 
 class ConfigManager:
     """Manages application configuration and persistence"""
     
-    def __init__(self, config_path: Optional[str] = None):
+    def __init__(self, config_path: Optional[str] = None,
+                 flush_scheduler: Optional[Callable[[Callable[[], None]], None]] = None):
         """
         Initialize the configuration manager
         
         Args:
             config_path: Path to the configuration file,
                          defaults to ~/.youtube_trimmer.json
+            flush_scheduler: Called with a callback to run shortly after the
+                             first unsaved change (e.g. via a single-shot timer);
+                             without it changes are written by flush() only
         """
         if config_path is None:
             self.config_path = os.path.expanduser("~/.youtube_trimmer.json")
         else:
             self.config_path = config_path
         
+        # Digest of the file contents as last read or written, used to skip
+        # identical saves
+        self._last_saved_digest: Optional[bytes] = None
+        
         self.config = self.load_config()
+        
+        # Changes are written by flush() rather than on every set(); the exit
+        # hook holds only a weak reference so it doesn't keep this instance alive
+        self._dirty = False
+        self._flush_scheduler = flush_scheduler
+        self._flush_scheduled = False
+        atexit.register(_flush_at_exit, weakref.ref(self))
+        
+        # Recent files as a bounded deque plus a set for membership tests,
+        # built on first use from the "recent_files" list
+        self._recent: Optional[Deque[str]] = None
+        self._recent_set: Set[str] = set()
     
     def load_config(self) -> Dict[str, Any]:
         """
@@ -49,34 +116,79 @@ class ConfigManager:
         """
         if os.path.exists(self.config_path):
             try:
-                with open(self.config_path, 'r') as f:
-                    config = json.load(f)
+                with open(self.config_path, 'rb') as f:
+                    data = f.read()
+                config = _loads(data)
+                self._last_saved_digest = _digest(data)
                 
-                # Ensure all default keys exist
-                for key, value in DEFAULT_CONFIG.items():
-                    if key not in config:
-                        config[key] = value
-                
-                return config
+                # Ensure all default keys exist, keeping saved values
+                return {**_default_config(), **config}
             except (json.JSONDecodeError, IOError):
                 # If loading fails, use defaults
-                return DEFAULT_CONFIG.copy()
+                return _default_config()
         else:
-            return DEFAULT_CONFIG.copy()
+            return _default_config()
     
     def save_config(self) -> bool:
         """
         Save configuration to file
         
+        The file is replaced atomically via a temporary file, and the write
+        is skipped when the content is unchanged since the last save.
+        
         Returns:
             bool: True if successful, False otherwise
         """
-        try:
-            with open(self.config_path, 'w') as f:
-                json.dump(self.config, f, indent=2)
+        data = _dumps(self.config)
+        digest = _digest(data)
+        if digest == self._last_saved_digest:
             return True
+        
+        temp_path = self.config_path + ".tmp"
+        try:
+            with open(temp_path, 'wb') as f:
+                f.write(data)
+                # Make sure the data is on disk before it replaces the old file
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_path, self.config_path)
         except IOError:
+            # Don't leave a partial temporary file behind
+            try:
+                os.remove(temp_path)
+            except IOError:
+                pass
             return False
+        
+        self._last_saved_digest = digest
+        return True
+    
+    def flush(self) -> bool:
+        """
+        Write pending configuration changes to file
+        
+        Returns:
+            bool: True if nothing was pending or the save succeeded
+        """
+        if not self._dirty:
+            return True
+        
+        if self.save_config():
+            self._dirty = False
+            return True
+        return False
+    
+    def _mark_dirty(self) -> None:
+        """Record an unsaved change and schedule a deferred flush if possible"""
+        self._dirty = True
+        if self._flush_scheduler is not None and not self._flush_scheduled:
+            self._flush_scheduled = True
+            self._flush_scheduler(self._scheduled_flush)
+    
+    def _scheduled_flush(self) -> None:
+        """Run the deferred flush requested by _mark_dirty"""
+        self._flush_scheduled = False
+        self.flush()
     
     def get(self, key: str, default: Any = None) -> Any:
         """
@@ -95,12 +207,32 @@ class ConfigManager:
         """
         Set a configuration value
         
+        The change is kept in memory until the scheduled flush runs, or
+        until flush() is called, at the latest when the interpreter exits.
+        
         Args:
             key: Configuration key
             value: Value to set
         """
         self.config[key] = value
-        self.save_config()
+        self._mark_dirty()
+        
+        # Rebuild the recent files deque if its source was replaced
+        if key in ("recent_files", "max_recent_files"):
+            self._recent = None
+    
+    def _recent_files(self) -> Deque[str]:
+        """
+        Get the bounded recent files deque, building it if needed
+        
+        Returns:
+            deque: Recent files, most recent first
+        """
+        if self._recent is None:
+            max_recent = self.get("max_recent_files", 5)
+            self._recent = deque(self.get("recent_files", [])[:max_recent], maxlen=max_recent)
+            self._recent_set = set(self._recent)
+        return self._recent
     
     def add_recent_file(self, file_path: str) -> None:
         """
@@ -109,21 +241,22 @@ class ConfigManager:
         Args:
             file_path: Path to the file
         """
-        recent_files = self.get("recent_files", [])
+        recent_files = self._recent_files()
         
-        # Remove if already exists
-        if file_path in recent_files:
+        if file_path in self._recent_set:
+            # Remove if already exists
             recent_files.remove(file_path)
+        elif recent_files and len(recent_files) == recent_files.maxlen:
+            # Drop the oldest entry to make room
+            self._recent_set.discard(recent_files.pop())
         
         # Add to the beginning
-        recent_files.insert(0, file_path)
-        
-        # Trim to max length
-        max_recent = self.get("max_recent_files", 5)
-        if len(recent_files) > max_recent:
-            recent_files = recent_files[:max_recent]
+        if recent_files.maxlen:
+            recent_files.appendleft(file_path)
+            self._recent_set.add(file_path)
         
-        self.set("recent_files", recent_files)
+        self.config["recent_files"] = list(recent_files)
+        self._mark_dirty()
     
     def get_preset_fades(self) -> List[Dict[str, Any]]:
         """
@@ -132,7 +265,9 @@ class ConfigManager:
         Returns:
             list: List of fade presets
         """
-        return self.get("preset_fades", DEFAULT_CONFIG["preset_fades"])
+        if "preset_fades" not in self.config:
+            self.config["preset_fades"] = _default_config()["preset_fades"]
+        return self.config["preset_fades"]
     
     def add_preset_fade(self, name: str, fade_in: float, fade_out: float) -> None:
         """